@@ -5,9 +5,10 @@ __all__ = [
     "get_algorithm",
     "create_configuration",
     "UpdaterCallBack",
+    "ChannelsLastCallBack",
 ]
 
 
 from .algorithms import get_algorithm, get_available_algorithms
-from .callback import UpdaterCallBack
+from .callback import ChannelsLastCallBack, UpdaterCallBack
 from .configuration import create_configuration
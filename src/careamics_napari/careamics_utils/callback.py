@@ -1,8 +1,10 @@
 """PyTorch Lightning callback used to update GUI with progress."""
 
-from queue import Queue
-from typing import Any
+import time
+from threading import Event
+from typing import Any, Optional
 
+import torch
 from pytorch_lightning import LightningModule, Trainer
 from pytorch_lightning.callbacks import Callback
 from typing_extensions import Self
@@ -13,6 +15,10 @@ from careamics_napari.signals import (
     TrainUpdate,
     TrainUpdateType,
 )
+from careamics_napari.utils import NotifiableDeque
+
+BATCH_UPDATE_PERIOD = 1 / 30
+"""Minimum time, in seconds, between two batch updates sent to the UI."""
 
 
 class UpdaterCallBack(Callback):
@@ -20,48 +26,65 @@ class UpdaterCallBack(Callback):
 
     Parameters
     ----------
-    training_queue : Queue
+    training_queue : NotifiableDeque
         Training queue used to pass updates between threads.
-    prediction_queue : Queue
+    prediction_queue : NotifiableDeque
         Prediction queue used to pass updates between threads.
+    stop_event : Event or None, default=None
+        Event used to request the training to stop.
 
     Attributes
     ----------
-    training_queue : Queue
+    training_queue : NotifiableDeque
         Training queue used to pass updates between threads.
-    prediction_queue : Queue
+    prediction_queue : NotifiableDeque
         Prediction queue used to pass updates between threads.
+    stop_event : Event or None
+        Event used to request the training to stop.
     """
 
-    def __init__(self: Self, training_queue: Queue, prediction_queue: Queue) -> None:
+    def __init__(
+        self: Self,
+        training_queue: NotifiableDeque,
+        prediction_queue: NotifiableDeque,
+        stop_event: Optional[Event] = None,
+    ) -> None:
         """Initialize the callback.
 
         Parameters
         ----------
-        training_queue : Queue
+        training_queue : NotifiableDeque
             Training queue used to pass updates between threads.
-        prediction_queue : Queue
+        prediction_queue : NotifiableDeque
             Prediction queue used to pass updates between threads.
+        stop_event : Event or None, default=None
+            Event used to request the training to stop.
         """
         self.training_queue = training_queue
         self.prediction_queue = prediction_queue
+        self.stop_event = stop_event
 
-    def get_train_queue(self) -> Queue:
+        # batch updates are throttled to avoid flooding the UI
+        self._last_batch_ts = 0.0
+        self._last_batch_epoch = -1
+        self._last_batch: Optional[int] = None
+
+    def get_train_queue(self) -> NotifiableDeque:
         """Return the training queue.
 
         Returns
         -------
-        Queue
+        NotifiableDeque
             Training queue.
         """
         return self.training_queue
 
-    def get_predict_queue(self) -> Queue:
+    def get_predict_queue(self) -> NotifiableDeque:
         """Return the prediction queue.
 
         Returns
         -------
-        Queue
+        NotifiableDeque
             Prediction queue.
         """
         return self.prediction_queue
@@ -79,7 +102,7 @@ class UpdaterCallBack(Callback):
         # compute the number of batches
         len_dataloader = len(trainer.train_dataloader)  # type: ignore
 
-        self.training_queue.put(
+        self.training_queue.append(
             TrainUpdate(
                 TrainUpdateType.MAX_BATCH,
                 int(len_dataloader / trainer.accumulate_grad_batches),
@@ -87,7 +110,7 @@ class UpdaterCallBack(Callback):
         )
 
         # register number of epochs
-        self.training_queue.put(
+        self.training_queue.append(
             TrainUpdate(TrainUpdateType.MAX_EPOCH, trainer.max_epochs)
         )
 
@@ -103,7 +126,7 @@ class UpdaterCallBack(Callback):
         pl_module : LightningModule
             PyTorch Lightning module.
         """
-        self.training_queue.put(
+        self.training_queue.append(
             TrainUpdate(TrainUpdateType.EPOCH, trainer.current_epoch)
         )
 
@@ -117,15 +140,23 @@ class UpdaterCallBack(Callback):
         pl_module : LightningModule
             PyTorch Lightning module.
         """
+        # guarantee that the last batch index of the epoch is shown, before the
+        # losses and the following epoch or end of training updates
+        if self._last_batch is not None:
+            self.training_queue.append(
+                TrainUpdate(TrainUpdateType.BATCH, self._last_batch)
+            )
+            self._last_batch = None
+
         metrics = trainer.progress_bar_metrics
 
         if "train_loss_epoch" in metrics:
-            self.training_queue.put(
+            self.training_queue.append(
                 TrainUpdate(TrainUpdateType.LOSS, metrics["train_loss_epoch"])
             )
 
         if "val_loss" in metrics:
-            self.training_queue.put(
+            self.training_queue.append(
                 TrainUpdate(TrainUpdateType.VAL_LOSS, metrics["val_loss"])
             )
 
@@ -134,6 +165,9 @@ class UpdaterCallBack(Callback):
     ) -> None:
         """Method called at the beginning of each batch.
 
+        Batch updates are sent at most every `BATCH_UPDATE_PERIOD` seconds, or
+        whenever a new epoch starts.
+
         Parameters
         ----------
         trainer : Trainer
@@ -145,7 +179,45 @@ class UpdaterCallBack(Callback):
         batch_idx : int
             Index of the batch.
         """
-        self.training_queue.put(TrainUpdate(TrainUpdateType.BATCH, batch_idx))
+        now = time.monotonic()
+        self._last_batch = batch_idx
+
+        if (
+            trainer.current_epoch != self._last_batch_epoch
+            or now - self._last_batch_ts > BATCH_UPDATE_PERIOD
+        ):
+            self._last_batch_ts = now
+            self._last_batch_epoch = trainer.current_epoch
+
+            self.training_queue.append_lossy(
+                TrainUpdate(TrainUpdateType.BATCH, batch_idx)
+            )
+
+    def on_train_batch_end(
+        self,
+        trainer: Trainer,
+        pl_module: LightningModule,
+        outputs: Any,
+        batch: Any,
+        batch_idx: int,
+    ) -> None:
+        """Method called at the end of each batch.
+
+        Parameters
+        ----------
+        trainer : Trainer
+            PyTorch Lightning trainer.
+        pl_module : LightningModule
+            PyTorch Lightning module.
+        outputs : Any
+            Outputs of the training step.
+        batch : Any
+            Batch.
+        batch_idx : int
+            Index of the batch.
+        """
+        if self.stop_event is not None and self.stop_event.is_set():
+            trainer.should_stop = True
 
     def on_predict_start(self, trainer: Trainer, pl_module: LightningModule) -> None:
         """Method called at the beginning of the prediction.
@@ -157,7 +229,7 @@ class UpdaterCallBack(Callback):
         pl_module : LightningModule
             PyTorch Lightning module.
         """
-        self.prediction_queue.put(
+        self.prediction_queue.append(
             PredictionUpdate(
                 PredictionUpdateType.MAX_SAMPLES,
                 # lightning returns a number of batches per dataloader
@@ -188,6 +260,46 @@ class UpdaterCallBack(Callback):
         dataloader_idx : int, default=0
             Index of the dataloader.
         """
-        self.prediction_queue.put(
+        self.prediction_queue.append(
             PredictionUpdate(PredictionUpdateType.SAMPLE_IDX, batch_idx)
         )
+
+
+class ChannelsLastCallBack(Callback):
+    """PyTorch Lightning callback converting the model to channels last memory format.
+
+    Channels last is faster for convolutions on GPUs with tensor cores, in
+    particular with mixed precision.
+
+    Parameters
+    ----------
+    is_3d : bool, default=False
+        Whether the model is 3D.
+
+    Attributes
+    ----------
+    memory_format : torch.memory_format
+        Memory format of the model parameters.
+    """
+
+    def __init__(self: Self, is_3d: bool = False) -> None:
+        """Initialize the callback.
+
+        Parameters
+        ----------
+        is_3d : bool, default=False
+            Whether the model is 3D.
+        """
+        self.memory_format = torch.channels_last_3d if is_3d else torch.channels_last
+
+    def on_fit_start(self, trainer: Trainer, pl_module: LightningModule) -> None:
+        """Method called at the beginning of fit.
+
+        Parameters
+        ----------
+        trainer : Trainer
+            PyTorch Lightning trainer.
+        pl_module : LightningModule
+            PyTorch Lightning module.
+        """
+        pl_module.to(memory_format=self.memory_format)
@@ -148,3 +148,6 @@ class TrainingSignal:
 
     val_minimum_split: int = 1
     """Minimum number of patches or images in the validation set."""
+
+    fast_mode: bool = False
+    """Whether to use mixed precision and channels last memory format on GPUs."""
@@ -1,7 +1,7 @@
 """CAREamics training Qt widget."""
 
 from pathlib import Path
-from queue import Queue
+from threading import Event
 from typing import TYPE_CHECKING, Optional
 
 from careamics import CAREamist
@@ -10,6 +10,7 @@ from qtpy.QtCore import Qt
 from qtpy.QtWidgets import QHBoxLayout, QStackedWidget, QVBoxLayout, QWidget
 from typing_extensions import Self
 
+from careamics_napari.careamics_utils.free_memory import free_memory
 from careamics_napari.signals import (
     PredictionSignal,
     PredictionState,
@@ -39,6 +40,7 @@ from careamics_napari.widgets import (
     TrainProgressWidget,
     create_gpu_label,
 )
+from careamics_napari.utils import NotifiableDeque
 from careamics_napari.workers import predict_worker, save_worker, train_worker
 from careamics_napari.utils.axes_utils import reshape_prediction
 
@@ -127,8 +129,11 @@ class TrainPlugin(QWidget):
         self.train_config_signal.events.is_3d.connect(self._set_pred_3d)
 
         # create queues, used to communicate between the threads and the UI
-        self._training_queue: Queue = Queue(10)
-        self._prediction_queue: Queue = Queue(10)
+        self._training_queue = NotifiableDeque()
+        self._prediction_queue = NotifiableDeque()
+
+        # event used to request the training thread to stop
+        self._stop_training = Event()
 
         # set workdir
         self.train_config_signal.work_dir = Path.cwd()
@@ -241,17 +246,22 @@ class TrainPlugin(QWidget):
             New state.
         """
         if state == TrainingState.TRAINING:
+            self._stop_training.clear()
+
             self.train_worker = train_worker(
                 self.train_config_signal,
                 self._training_queue,
                 self._prediction_queue,
                 self.careamist,
+                self._stop_training,
             )
 
             self.train_worker.yielded.connect(self._update_from_training)
             self.train_worker.start()
 
         elif state == TrainingState.STOPPED:
+            self._stop_training.set()
+
             if self.careamist is not None:
                 self.careamist.stop_training()
 
@@ -406,7 +416,21 @@ class TrainPlugin(QWidget):
             Close event.
         """
         super().closeEvent(event)
-        # TODO check training or prediction and stop it
+        # TODO check prediction and stop it
+
+        # stop training and release the memory once the training worker is done
+        self._stop_training.set()
+
+        worker = getattr(self, "train_worker", None)
+        if worker is not None and worker.is_running:
+            worker.finished.connect(self._free_memory)
+        else:
+            self._free_memory()
+
+    def _free_memory(self) -> None:
+        """Release the CAREamist instance and the GPU memory it holds."""
+        free_memory(self.careamist)
+        self.careamist = None
 
 
 if __name__ == "__main__":
@@ -2,8 +2,10 @@
 
 __all__ = [
     "REF_AXES",
+    "NotifiableDeque",
     "are_axes_valid",
     "filter_dimensions",
 ]
 
 from .axes_utils import REF_AXES, are_axes_valid, filter_dimensions
+from .notifiable_deque import NotifiableDeque
@@ -1,6 +1,7 @@
 """Utilities to check axes validity."""
 
 import warnings
+from functools import lru_cache
 from itertools import permutations
 import numpy as np
 
@@ -26,6 +27,27 @@ def filter_dimensions(shape_length: int, is_3D: bool) -> list[str]:
     list of str
         List of valid axes.
     """
+    return list(_filter_dimensions(shape_length, is_3D))
+
+
+@lru_cache(maxsize=32)
+def _filter_dimensions(shape_length: int, is_3D: bool) -> tuple[str, ...]:
+    """Compute the valid axes for a given shape and dimensions.
+
+    The results are cached since there are only a handful of possible arguments.
+
+    Parameters
+    ----------
+    shape_length : int
+        Number of dimensions.
+    is_3D : bool
+        Whether the dimensions include Z.
+
+    Returns
+    -------
+    tuple of str
+        Valid axes.
+    """
     axes = list(REF_AXES)
     n = shape_length
 
@@ -33,8 +55,8 @@ def filter_dimensions(shape_length: int, is_3D: bool) -> list[str]:
         axes.remove("Z")
 
     if n > len(axes):
-        warnings.warn("Data shape length is too large.", stacklevel=3)
-        return []
+        warnings.warn("Data shape length is too large.", stacklevel=4)
+        return ()
     else:
         all_permutations = ["".join(p) for p in permutations(axes, n)]
 
@@ -47,7 +69,7 @@ def filter_dimensions(shape_length: int, is_3D: bool) -> list[str]:
         if len(all_permutations) == 0 and not is_3D:
             all_permutations = ["YX"]
 
-        return all_permutations
+        return tuple(all_permutations)
 
 
 # TODO should use function from CAREamics?
@@ -99,6 +121,11 @@ def reshape_prediction(prediction: np.ndarray, axes: str, is_3d: bool) -> np.nda
     -------
     np.ndarray
         Reshaped prediction.
+
+    Raises
+    ------
+    ValueError
+        If the input axes do not contain all the prediction axes.
     """
         
     # model outputs SC(Z)YX
@@ -120,7 +147,10 @@ def reshape_prediction(prediction: np.ndarray, axes: str, is_3d: bool) -> np.nda
         remove_s = True
 
     # TODO: check if all axes are present
-    assert all([ax in input_axes for ax in pred_axes])
+    if not all(ax in input_axes for ax in pred_axes):
+        raise ValueError(
+            f"Axes {axes} are not compatible with the prediction axes {pred_axes}."
+        )
 
     indices = [pred_axes.index(ax) for ax in input_axes]
     prediction = np.transpose(prediction, indices)
@@ -25,3 +25,14 @@ def is_gpu_available() -> bool:
         )
     else:
         return cuda.is_available()
+
+
+def is_tensor_core_available() -> bool:
+    """Check if a CUDA GPU with tensor cores (compute capability >= 7.0) is available.
+
+    Returns
+    -------
+    bool
+        True if such a GPU is available, False otherwise.
+    """
+    return cuda.is_available() and cuda.get_device_capability() >= (7, 0)
@@ -0,0 +1,139 @@
+"""Deque used to pass updates between threads."""
+
+from collections import deque
+from collections.abc import Iterator
+from threading import Event
+from typing import Any, Optional
+
+from typing_extensions import Self
+
+
+class NotifiableDeque:
+    """Thread-safe deque notifying a consumer when new items are appended.
+
+    `collections.deque` appends and pops are atomic, this class simply pairs the
+    deque with a `threading.Event` so that the consumer can sleep until the producer
+    appends a new item, without the lock overhead of `queue.Queue`.
+
+    Items that can be dropped if the consumer lags behind (e.g. progress updates)
+    are appended with `append_lossy` to a separate bounded deque, so that the
+    producer never blocks and no other item is ever discarded. Pending lossy items
+    are considered superseded by any item appended with `append`, and are discarded.
+
+    Parameters
+    ----------
+    maxlen : int or None, default=None
+        Maximum length of the deque, oldest items are discarded when full.
+    lossy_maxlen : int, default=10
+        Maximum length of the deque holding the lossy items.
+    """
+
+    def __init__(
+        self: Self, maxlen: Optional[int] = None, lossy_maxlen: int = 10
+    ) -> None:
+        """Initialize the deque.
+
+        Parameters
+        ----------
+        maxlen : int or None, default=None
+            Maximum length of the deque, oldest items are discarded when full.
+        lossy_maxlen : int, default=10
+            Maximum length of the deque holding the lossy items.
+        """
+        self._deque: deque = deque(maxlen=maxlen)
+        self._lossy_deque: deque = deque(maxlen=lossy_maxlen)
+        self._event = Event()
+
+    def __len__(self: Self) -> int:
+        """Return the number of items in the deque, including lossy items.
+
+        Returns
+        -------
+        int
+            Number of items.
+        """
+        return len(self._deque) + len(self._lossy_deque)
+
+    def append(self: Self, item: Any) -> None:
+        """Append an item and notify the consumer.
+
+        Pending lossy items are discarded, so that they are never drained after a
+        more recent item.
+
+        Parameters
+        ----------
+        item : Any
+            Item to append.
+        """
+        self._lossy_deque.clear()
+        self._deque.append(item)
+        self._event.set()
+
+    def append_lossy(self: Self, item: Any) -> None:
+        """Append an item that may be discarded, and notify the consumer.
+
+        If more than `lossy_maxlen` lossy items are pending, the oldest ones are
+        discarded.
+
+        Parameters
+        ----------
+        item : Any
+            Item to append.
+        """
+        self._lossy_deque.append(item)
+        self._event.set()
+
+    def popleft(self: Self) -> Any:
+        """Remove and return the oldest item, ignoring lossy items.
+
+        Returns
+        -------
+        Any
+            Oldest item.
+
+        Raises
+        ------
+        IndexError
+            If the deque is empty.
+        """
+        return self._deque.popleft()
+
+    def wait(self: Self, timeout: Optional[float] = None) -> bool:
+        """Wait until items are available.
+
+        Parameters
+        ----------
+        timeout : float or None, default=None
+            Maximum time to wait, in seconds. If None, wait indefinitely.
+
+        Returns
+        -------
+        bool
+            Whether items have been appended since the last drain.
+        """
+        return self._event.wait(timeout)
+
+    def drain(self: Self) -> Iterator[Any]:
+        """Pop all available items, oldest first, followed by the lossy items.
+
+        The notification is reset before popping, so that items appended while
+        draining will trigger the next `wait`.
+
+        Yields
+        ------
+        Any
+            Items in the order they were appended, lossy items last.
+        """
+        self._event.clear()
+
+        while self._deque:
+            yield self._deque.popleft()
+
+        while self._lossy_deque:
+            yield self._lossy_deque.popleft()
+
+    def clear(self: Self) -> None:
+        """Remove all items from the deque."""
+        self._event.clear()
+        self._deque.clear()
+        self._lossy_deque.clear()
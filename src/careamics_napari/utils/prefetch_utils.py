@@ -0,0 +1,38 @@
+"""Utilities to prefetch training data from disk before it is accessed."""
+
+import os
+from pathlib import Path
+from typing import Union
+
+
+def prefetch_path(path: Union[str, Path]) -> None:
+    """Advise the operating system that files will soon be read.
+
+    If `path` is a folder, all files it contains are prefetched. This is a no-op on
+    platforms without `posix_fadvise`.
+
+    Parameters
+    ----------
+    path : str or Path
+        Path to a file or a folder.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+
+    path = Path(path)
+    files = path.iterdir() if path.is_dir() else [path]
+
+    for file in files:
+        if not file.is_file():
+            continue
+
+        try:
+            fd = os.open(file, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        except OSError:
+            # prefetching is only a hint
+            pass
+
@@ -1,14 +1,21 @@
 """Widget for specifying axes order."""
 
+import re
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
 from qtpy import QtGui
 from qtpy.QtWidgets import QHBoxLayout, QLabel, QLineEdit, QWidget
 from typing_extensions import Self
 
 from careamics_napari.signals import TrainingSignal
-from careamics_napari.utils import REF_AXES, are_axes_valid
+from careamics_napari.utils import REF_AXES
+
+# equivalent to `are_axes_valid`: reference axes only, no repeated axis, and
+# contiguous X and Y
+_VALID_AXES = re.compile(
+    rf"(?!.*(.).*\1)[{REF_AXES}]*(?:XY|YX)[{REF_AXES}]*", re.IGNORECASE
+)
 
 
 class Highlight(Enum):
@@ -24,6 +31,22 @@ class Highlight(Enum):
     """Axes not accepted."""
 
 
+def _are_axes_valid(axes: str) -> bool:
+    """Check if axes are valid using a precompiled regular expression.
+
+    Parameters
+    ----------
+    axes : str
+        Axes to check.
+
+    Returns
+    -------
+    bool
+        Whether the axes are valid.
+    """
+    return _VALID_AXES.fullmatch(axes) is not None
+
+
 class LettersValidator(QtGui.QValidator):
     """Custom validator.
 
@@ -50,7 +73,7 @@ class LettersValidator(QtGui.QValidator):
             Arbitrary keyword arguments.
         """
         QtGui.QValidator.__init__(self, *args, **kwargs)
-        self._options = options
+        self._options = frozenset(options)
 
     def validate(
         self: Self, value: str, pos: int
@@ -93,6 +116,13 @@ class AxesWidget(QWidget):
         Signal holding all training parameters to be set by the user.
     """
 
+    _STYLESHEETS: ClassVar[dict[Highlight, str]] = {
+        Highlight.VALID: "color: white;",
+        Highlight.UNRECOGNIZED: "color: red;",
+        Highlight.NOT_ACCEPTED: "color: orange;",
+    }
+    """Text field style sheets for each highlight type."""
+
     # TODO unused parameters
     def __init__(
         self, n_axes=3, is_3D=False, training_signal: Optional[TrainingSignal] = None
@@ -107,16 +137,23 @@ class AxesWidget(QWidget):
             Whether the data is 3D.
         training_signal : TrainingSignal or None, default=None
             Signal holding all training parameters to be set by the user.
+
+        Raises
+        ------
+        ValueError
+            If the number of axes is not between 1 and 6.
         """
         super().__init__()
         self.configuration_signal = training_signal
 
-        # # max axes is 6
-        # assert 0 < n_axes <= 6
+        # max axes is 6
+        if not 0 < n_axes <= 6:
+            raise ValueError(f"Number of axes must be between 1 and 6, got {n_axes}.")
 
         # self.n_axes = n_axes
         # self.is_3D = is_3D
         self.is_text_valid = True
+        self._current_highlight: Optional[Highlight] = None
 
         # QtPy
         self.setLayout(QHBoxLayout())
@@ -162,7 +199,7 @@ class AxesWidget(QWidget):
         axes = self.get_axes()
 
         # change text color according to axes validation
-        if are_axes_valid(axes):
+        if _are_axes_valid(axes):
             self._set_text_color(Highlight.VALID)
             # if axes.upper() in filter_dimensions(self.n_axes, self.is_3D):
             #     self._set_text_color(Highlight.VALID)
@@ -181,12 +218,12 @@ class AxesWidget(QWidget):
         """
         self.is_text_valid = highlight == Highlight.VALID
 
-        if highlight == Highlight.UNRECOGNIZED:
-            self.text_field.setStyleSheet("color: red;")
-        elif highlight == Highlight.NOT_ACCEPTED:
-            self.text_field.setStyleSheet("color: orange;")
-        else:  # VALID
-            self.text_field.setStyleSheet("color: white;")
+        # changing the style sheet triggers a re-polish of the widget
+        if highlight == self._current_highlight:
+            return
+        self._current_highlight = highlight
+
+        self.text_field.setStyleSheet(self._STYLESHEETS[highlight])
 
     def get_default_text(self: Self) -> str:
         """Return the default text.
@@ -230,7 +267,6 @@ class AxesWidget(QWidget):
         bool
             Whether the axes are valid.
         """
-        self._validate_text()  # probably unnecessary
         return self.is_text_valid
 
     def set_text_field(self: Self, text: str) -> None:
@@ -227,6 +227,22 @@ class AdvancedConfigurationWindow(QDialog):
         model_params.setLayout(model_params_layout)
         self.layout().addWidget(model_params)
 
+        ##################
+        # performance
+        performance = QGroupBox("Performance")
+        performance_layout = QFormLayout()
+
+        self.fast_mode = QCheckBox("Fast mode")
+        self.fast_mode.setToolTip(
+            "Check to train with mixed precision and channels last\n"
+            "memory format. Only applied on CUDA GPUs with tensor cores."
+        )
+        self.fast_mode.setChecked(self.configuration_signal.fast_mode)
+
+        performance_layout.addRow(self.fast_mode)
+        performance.setLayout(performance_layout)
+        self.layout().addWidget(performance)
+
         ##################
         # save button
         button_widget = QWidget()
@@ -298,6 +314,7 @@ class AdvancedConfigurationWindow(QDialog):
             self.configuration_signal.use_n2v2 = self.use_n2v2.isChecked()
             self.configuration_signal.depth = self.model_depth.value()
             self.configuration_signal.num_conv_filters = self.size_conv_filters.value()
+            self.configuration_signal.fast_mode = self.fast_mode.isChecked()
 
         self.close()
 
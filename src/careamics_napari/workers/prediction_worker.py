@@ -2,7 +2,6 @@
 
 import traceback
 from collections.abc import Generator
-from queue import Queue
 from threading import Thread
 from typing import Optional, Union
 
@@ -15,6 +14,7 @@ from careamics_napari.signals import (
     PredictionUpdate,
     PredictionUpdateType,
 )
+from careamics_napari.utils import NotifiableDeque
 
 
 # TODO register CAREamist to continue training and predict
@@ -24,7 +24,7 @@ from careamics_napari.signals import (
 def predict_worker(
     careamist: CAREamist,
     config_signal: PredictionSignal,
-    update_queue: Queue,
+    update_queue: NotifiableDeque,
 ) -> Generator[PredictionUpdate, None, None]:
     """Model prediction worker.
 
@@ -34,7 +34,7 @@ def predict_worker(
         CAREamist instance.
     config_signal : PredictionSignal
         Prediction signal.
-    update_queue : Queue
+    update_queue : NotifiableDeque
         Queue used to send updates to the UI.
 
     Yields
@@ -54,24 +54,28 @@ def predict_worker(
     training.start()
 
     # look for updates
-    while True:
-        update: PredictionUpdate = update_queue.get(block=True)
+    done = False
+    while not done:
+        update_queue.wait()
 
-        yield update
+        update: PredictionUpdate
+        for update in update_queue.drain():
+            yield update
 
-        if (
-            update.type == PredictionUpdateType.STATE
-            or update.type == PredictionUpdateType.EXCEPTION
-        ):
-            break
+            if (
+                update.type == PredictionUpdateType.STATE
+                or update.type == PredictionUpdateType.EXCEPTION
+            ):
+                done = True
+                break
 
 
-def _push_exception(queue: Queue, e: Exception) -> None:
+def _push_exception(queue: NotifiableDeque, e: Exception) -> None:
     """Push an exception to the queue.
 
     Parameters
     ----------
-    queue : Queue
+    queue : NotifiableDeque
         Queue.
     e : Exception
         Exception.
@@ -81,13 +85,13 @@ def _push_exception(queue: Queue, e: Exception) -> None:
     except Exception as _:
         traceback.print_exc()
 
-    queue.put(PredictionUpdate(PredictionUpdateType.EXCEPTION, e))
+    queue.append(PredictionUpdate(PredictionUpdateType.EXCEPTION, e))
 
 
 def _predict(
     careamist: CAREamist,
     config_signal: PredictionSignal,
-    update_queue: Queue,
+    update_queue: NotifiableDeque,
 ) -> None:
     """Run the prediction.
 
@@ -97,7 +101,7 @@ def _predict(
         CAREamist instance.
     config_signal : PredictionSignal
         Prediction signal.
-    update_queue : Queue
+    update_queue : NotifiableDeque
         Queue used to send updates to the UI.
     """
     # Format data
@@ -162,7 +166,7 @@ def _predict(
             batch_size=batch_size,
         )
 
-        update_queue.put(PredictionUpdate(PredictionUpdateType.SAMPLE, result))
+        update_queue.append(PredictionUpdate(PredictionUpdateType.SAMPLE, result))
 
         # # TODO can we use this to monkey patch the training process?
         # import time
@@ -186,8 +190,10 @@ def _predict(
     except Exception as e:
         traceback.print_exc()
 
-        update_queue.put(PredictionUpdate(PredictionUpdateType.EXCEPTION, e))
+        update_queue.append(PredictionUpdate(PredictionUpdateType.EXCEPTION, e))
         return
 
     # signify end of prediction
-    update_queue.put(PredictionUpdate(PredictionUpdateType.STATE, PredictionState.DONE))
+    update_queue.append(
+        PredictionUpdate(PredictionUpdateType.STATE, PredictionState.DONE)
+    )
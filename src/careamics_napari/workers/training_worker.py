@@ -2,16 +2,18 @@
 
 import traceback
 from collections.abc import Generator
-from queue import Queue
-from threading import Thread
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Event, Thread
+from typing import Any, Optional
 
 import napari.utils.notifications as ntf
 from careamics import CAREamist
 from careamics.config.support import SupportedAlgorithm
 from napari.qt.threading import thread_worker
+from pytorch_lightning.callbacks import Callback
 
-from careamics_napari.careamics_utils import UpdaterCallBack
+from careamics_napari.careamics_utils import ChannelsLastCallBack, UpdaterCallBack
 from careamics_napari.careamics_utils.configuration import create_configuration
 from careamics_napari.signals import (
     TrainingSignal,
@@ -19,6 +21,12 @@ from careamics_napari.signals import (
     TrainUpdate,
     TrainUpdateType,
 )
+from careamics_napari.utils import NotifiableDeque
+from careamics_napari.utils.gpu_utils import is_tensor_core_available
+from careamics_napari.utils.prefetch_utils import prefetch_path
+
+UPDATE_TIMEOUT = 1.0
+"""Time, in seconds, after which the training thread is checked for liveness."""
 
 
 # TODO register CAREamist to continue training and predict
@@ -27,9 +35,10 @@ from careamics_napari.signals import (
 @thread_worker
 def train_worker(
     train_config_signal: TrainingSignal,
-    training_queue: Queue,
-    predict_queue: Queue,
+    training_queue: NotifiableDeque,
+    predict_queue: NotifiableDeque,
     careamist: Optional[CAREamist] = None,
+    stop_event: Optional[Event] = None,
 ) -> Generator[TrainUpdate, None, None]:
     """Model training worker.
 
@@ -37,19 +46,22 @@ def train_worker(
     ----------
     train_config_signal : TrainingSignal
         Training signal.
-    training_queue : Queue
+    training_queue : NotifiableDeque
         Training update queue.
-    predict_queue : Queue
+    predict_queue : NotifiableDeque
         Prediction update queue.
     careamist : CAREamist or None, default=None
         CAREamist instance.
+    stop_event : Event or None, default=None
+        Event used to request the training to stop, only registered when a new
+        CAREamist instance is created.
 
     Yields
     ------
     Generator[TrainUpdate, None, None]
         Updates.
     """
-    # start training thread
+    # start training thread, as a daemon so that it does not keep the process alive
     training = Thread(
         target=_train,
         args=(
@@ -57,43 +69,205 @@ def train_worker(
             training_queue,
             predict_queue,
             careamist,
+            stop_event,
         ),
+        daemon=True,
     )
     training.start()
 
-    # look for updates
-    while True:
-        update: TrainUpdate = training_queue.get(block=True)
-
-        yield update
-
+    # look for updates, all pending updates are drained before being yielded
+    done = False
+    while not done:
+        # the timeout allows detecting a training thread that died silently
         if (
-            update.type == TrainUpdateType.STATE and update.value == TrainingState.DONE
-        ) or (update.type == TrainUpdateType.EXCEPTION):
+            not training_queue.wait(timeout=UPDATE_TIMEOUT)
+            and not training.is_alive()
+            and len(training_queue) == 0
+        ):
+            yield TrainUpdate(
+                TrainUpdateType.EXCEPTION,
+                RuntimeError("Training thread stopped without reporting its end."),
+            )
             break
 
+        # only the latest batch index is relevant to the UI
+        update: TrainUpdate
+        for update in _coalesce_batches(list(training_queue.drain())):
+            yield update
+
+            if (
+                update.type == TrainUpdateType.STATE
+                and update.value == TrainingState.DONE
+            ) or (update.type == TrainUpdateType.EXCEPTION):
+                done = True
+                break
+
     # wait for the other thread to finish
     training.join()
 
 
-def _push_exception(queue: Queue, e: Exception) -> None:
+def _coalesce_batches(updates: list[TrainUpdate]) -> list[TrainUpdate]:
+    """Remove all batch updates but the most recent one.
+
+    Parameters
+    ----------
+    updates : list of TrainUpdate
+        Updates, in the order they were emitted.
+
+    Returns
+    -------
+    list of TrainUpdate
+        Updates with only the last batch update.
+    """
+    last_batch = -1
+    for i, update in enumerate(updates):
+        if update.type == TrainUpdateType.BATCH:
+            last_batch = i
+
+    return [
+        update
+        for i, update in enumerate(updates)
+        if update.type != TrainUpdateType.BATCH or i == last_batch
+    ]
+
+
+def _prefetch(*paths: Optional[str]) -> None:
+    """Prefetch training data from disk in background threads.
+
+    The first epoch then does not stall on I/O. This function does not wait for
+    the prefetching to finish.
+
+    Parameters
+    ----------
+    *paths : str or None
+        Paths to prefetch, `None` values are ignored.
+    """
+    executor = ThreadPoolExecutor(max_workers=2)
+
+    for path in paths:
+        if path is not None:
+            executor.submit(prefetch_path, path)
+
+    executor.shutdown(wait=False)
+
+
+@dataclass
+class SourceSpec:
+    """Training and validation sources, or the error preventing the training."""
+
+    train_source: Any = None
+    """Training data, either a path or an array."""
+
+    val_source: Any = None
+    """Validation data, either a path or an array."""
+
+    train_target: Any = None
+    """Training target data, either a path or an array."""
+
+    val_target: Any = None
+    """Validation target data, either a path or an array."""
+
+    error: Optional[Exception] = None
+    """Error raised if the sources are not valid."""
+
+
+def _validate_sources(config_signal: TrainingSignal) -> SourceSpec:
+    """Validate and collect the training and validation sources.
+
+    Parameters
+    ----------
+    config_signal : TrainingSignal
+        Training signal.
+
+    Returns
+    -------
+    SourceSpec
+        Training and validation sources, with `error` set if they are not valid.
+    """
+    if config_signal.load_from_disk:
+        if config_signal.path_train == "":
+            return SourceSpec(error=ValueError("Training data path is empty."))
+
+        sources = SourceSpec(
+            train_source=config_signal.path_train,
+            val_source=config_signal.path_val if config_signal.path_val != "" else None,
+        )
+
+        if sources.train_source == sources.val_source:
+            sources.val_source = None
+
+        if config_signal.algorithm != SupportedAlgorithm.N2V:
+            if config_signal.path_train_target == "":
+                return SourceSpec(
+                    error=ValueError("Training target data path is empty.")
+                )
+
+            sources.train_target = config_signal.path_train_target
+
+            if sources.val_source is not None and config_signal.path_val_target != "":
+                sources.val_target = config_signal.path_val_target
+
+        return sources
+
+    # dereference the layers once, and compare them by identity rather than
+    # comparing their (potentially large) data
+    train_layer = config_signal.layer_train
+    val_layer = config_signal.layer_val
+
+    if train_layer is None:
+        return SourceSpec(error=ValueError("Training layer has not been selected."))
+
+    sources = SourceSpec(train_source=train_layer.data)
+    if sources.train_source is None:
+        return SourceSpec(
+            error=ValueError(f"Training layer {train_layer.name} is empty.")
+        )
+
+    if val_layer is not None and val_layer is not train_layer:
+        sources.val_source = val_layer.data
+
+    if config_signal.algorithm != SupportedAlgorithm.N2V:
+        train_target_layer = config_signal.layer_train_target
+        val_target_layer = config_signal.layer_val_target
+
+        if train_target_layer is None:
+            return SourceSpec(
+                error=ValueError("Training target layer has not been selected.")
+            )
+
+        sources.train_target = train_target_layer.data
+        if sources.train_target is None:
+            return SourceSpec(
+                error=ValueError(
+                    f"Training target layer {train_target_layer.name} is empty."
+                )
+            )
+
+        if sources.val_source is not None and val_target_layer is not None:
+            sources.val_target = val_target_layer.data
+
+    return sources
+
+
+def _push_exception(queue: NotifiableDeque, e: Exception) -> None:
     """Push an exception to the queue.
 
     Parameters
     ----------
-    queue : Queue
+    queue : NotifiableDeque
         Queue.
     e : Exception
         Exception.
     """
-    queue.put(TrainUpdate(TrainUpdateType.EXCEPTION, e))
+    queue.append(TrainUpdate(TrainUpdateType.EXCEPTION, e))
 
 
 def _train(
     config_signal: TrainingSignal,
-    training_queue: Queue,
-    predict_queue: Queue,
+    training_queue: NotifiableDeque,
+    predict_queue: NotifiableDeque,
     careamist: Optional[CAREamist] = None,
+    stop_event: Optional[Event] = None,
 ) -> None:
     """Run the training.
 
@@ -101,12 +275,15 @@ def _train(
     ----------
     config_signal : TrainingSignal
         Training signal.
-    training_queue : Queue
+    training_queue : NotifiableDeque
         Training update queue.
-    predict_queue : Queue
+    predict_queue : NotifiableDeque
         Prediction update queue.
     careamist : CAREamist or None, default=None
         CAREamist instance.
+    stop_event : Event or None, default=None
+        Event used to request the training to stop, only registered when a new
+        CAREamist instance is created.
     """
     # get configuration and queue
     try:
@@ -115,9 +292,16 @@ def _train(
 
         # Create CAREamist
         if careamist is None:
-            careamist = CAREamist(
-                config, callbacks=[UpdaterCallBack(training_queue, predict_queue)]
-            )
+            callbacks: list[Callback] = [
+                UpdaterCallBack(training_queue, predict_queue, stop_event)
+            ]
+
+            # mixed precision and channels last only pay off with tensor cores
+            if config_signal.fast_mode and is_tensor_core_available():
+                config.training_config.precision = "16-mixed"
+                callbacks.append(ChannelsLastCallBack(is_3d=config_signal.is_3d))
+
+            careamist = CAREamist(config, callbacks=callbacks)
 
         else:
             # only update the number of epochs
@@ -133,113 +317,37 @@ def _train(
     except Exception as e:
         traceback.print_exc()
 
-        training_queue.put(TrainUpdate(TrainUpdateType.EXCEPTION, e))
+        # without configuration or CAREamist, the training cannot proceed
+        _push_exception(training_queue, e)
+        return
 
     # Register CAREamist
-    training_queue.put(TrainUpdate(TrainUpdateType.CAREAMIST, careamist))
+    training_queue.append(TrainUpdate(TrainUpdateType.CAREAMIST, careamist))
 
     # Format data
-    train_data_target = None
-    val_data_target = None
-
-    if config_signal.load_from_disk:
-
-        if config_signal.path_train == "":
-            _push_exception(training_queue, ValueError("Training data path is empty."))
-            return
-
-        train_data = config_signal.path_train
-        val_data = config_signal.path_val if config_signal.path_val != "" else None
+    sources = _validate_sources(config_signal)
 
-        if train_data == val_data:
-            val_data = None
-
-        if config_signal.algorithm != SupportedAlgorithm.N2V:
-            if config_signal.path_train_target == "":
-                _push_exception(
-                    training_queue, ValueError("Training target data path is empty.")
-                )
-                return
-
-            train_data_target = config_signal.path_train_target
-
-            if val_data is not None:
-                val_data_target = (
-                    config_signal.path_val_target
-                    if config_signal.path_val_target != ""
-                    else None
-                )
-
-    else:
-        if config_signal.layer_train is None:
-            _push_exception(
-                training_queue, ValueError("Training layer has not been selected.")
-            )
-            return
-
-        elif config_signal.layer_train.data is None:
-            _push_exception(
-                training_queue,
-                ValueError(
-                    f"Training layer {config_signal.layer_train.name} is empty."
-                ),
-            )
-            return
-        else:
-            train_data = config_signal.layer_train.data
-
-        val_data = (
-            config_signal.layer_val.data
-            if config_signal.layer_val is not None
-            and config_signal.layer_val.data is not None
-            else None
-        )
-
-        if (
-            config_signal.layer_train is not None
-            and config_signal.layer_val is not None
-            and (config_signal.layer_train.name == config_signal.layer_val.name)
-        ):
-            val_data = None
-
-        if config_signal.algorithm != SupportedAlgorithm.N2V:
-
-            if config_signal.layer_train_target is None:
-                _push_exception(
-                    training_queue,
-                    ValueError("Training target layer has not been selected."),
-                )
-                return
-            elif config_signal.layer_train_target.data is None:
-                _push_exception(
-                    training_queue,
-                    ValueError(
-                        f"Training target layer {config_signal.layer_train_target.name}"
-                        f" is empty."
-                    ),
-                )
-                return
-            else:
-                train_data_target = config_signal.layer_train_target.data
-
-            if val_data is not None:
-                val_data_target = (
-                    config_signal.layer_val_target.data
-                    if config_signal.layer_val_target is not None
-                    and config_signal.layer_val_target.data is not None
-                    else None
-                )
-            else:
-                val_data_target = None
+    if sources.error is not None:
+        _push_exception(training_queue, sources.error)
+        return
 
     # TODO add val percentage and val minimum
     # Train CAREamist
     try:
+        # start reading the files while the training is being set up
+        if config_signal.load_from_disk:
+            _prefetch(
+                sources.train_source,
+                sources.val_source,
+                sources.train_target,
+                sources.val_target,
+            )
+
         careamist.train(
-            train_source=train_data,
-            val_source=val_data,
-            train_target=train_data_target,
-            val_target=val_data_target,
+            train_source=sources.train_source,
+            val_source=sources.val_source,
+            train_target=sources.train_target,
+            val_target=sources.val_target,
             val_minimum_split=config_signal.val_minimum_split,
             val_percentage=config_signal.val_percentage,
         )
@@ -264,6 +372,6 @@ def _train(
     except Exception as e:
         traceback.print_exc()
 
-        training_queue.put(TrainUpdate(TrainUpdateType.EXCEPTION, e))
+        training_queue.append(TrainUpdate(TrainUpdateType.EXCEPTION, e))
 
-    training_queue.put(TrainUpdate(TrainUpdateType.STATE, TrainingState.DONE))
+    training_queue.append(TrainUpdate(TrainUpdateType.STATE, TrainingState.DONE))
@@ -0,0 +1,68 @@
+from types import SimpleNamespace
+
+import pytest
+
+from careamics_napari.careamics_utils import callback
+from careamics_napari.careamics_utils.callback import UpdaterCallBack
+from careamics_napari.signals import TrainingState, TrainUpdate, TrainUpdateType
+from careamics_napari.utils import NotifiableDeque
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Patch `time.monotonic` in the callback module with a settable clock."""
+    now = [100.0]
+    monkeypatch.setattr(callback.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_batch_updates_throttled(clock):
+    """Test that batch updates are sent on new epochs and at most once per period."""
+    queue = NotifiableDeque()
+    updater = UpdaterCallBack(queue, NotifiableDeque())
+    trainer = SimpleNamespace(current_epoch=0)
+
+    def sent_batches():
+        return [u.value for u in queue.drain() if u.type == TrainUpdateType.BATCH]
+
+    # first batch of the epoch is sent
+    updater.on_train_batch_start(trainer, None, None, 0)
+    assert sent_batches() == [0]
+
+    # batches within the period are throttled
+    clock[0] += callback.BATCH_UPDATE_PERIOD / 2
+    updater.on_train_batch_start(trainer, None, None, 1)
+    assert sent_batches() == []
+
+    # a batch after the period is sent
+    clock[0] += callback.BATCH_UPDATE_PERIOD
+    updater.on_train_batch_start(trainer, None, None, 2)
+    updater.on_train_batch_start(trainer, None, None, 3)
+    assert sent_batches() == [2]
+
+    # a new epoch is sent regardless of the period
+    trainer.current_epoch = 1
+    updater.on_train_batch_start(trainer, None, None, 0)
+    assert sent_batches() == [0]
+
+
+def test_last_batch_before_done(clock):
+    """Test that the last batch of an epoch is drained before the end of training."""
+    queue = NotifiableDeque()
+    updater = UpdaterCallBack(queue, NotifiableDeque())
+    trainer = SimpleNamespace(
+        current_epoch=0, progress_bar_metrics={"train_loss_epoch": 0.5}
+    )
+
+    # all batches after the first one are throttled, the first one is superseded
+    # by the end of epoch update
+    for i in range(100):
+        updater.on_train_batch_start(trainer, None, None, i)
+    updater.on_train_epoch_end(trainer, None)
+    queue.append(TrainUpdate(TrainUpdateType.STATE, TrainingState.DONE))
+
+    assert list(queue.drain()) == [
+        TrainUpdate(TrainUpdateType.BATCH, 99),
+        TrainUpdate(TrainUpdateType.LOSS, 0.5),
+        TrainUpdate(TrainUpdateType.STATE, TrainingState.DONE),
+    ]
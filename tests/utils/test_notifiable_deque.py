@@ -0,0 +1,68 @@
+from threading import Thread
+
+from careamics_napari.utils import NotifiableDeque
+
+
+def test_drain_order():
+    """Test that draining returns the items in the order they were appended."""
+    dq = NotifiableDeque()
+    for i in range(5):
+        dq.append(i)
+
+    assert dq.wait(timeout=0)
+    assert list(dq.drain()) == list(range(5))
+    assert len(dq) == 0
+    assert not dq.wait(timeout=0)
+
+
+def test_maxlen():
+    """Test that the oldest items are discarded when the deque is full."""
+    dq = NotifiableDeque(maxlen=2)
+    for i in range(5):
+        dq.append(i)
+
+    assert list(dq.drain()) == [3, 4]
+
+
+def test_lossy_maxlen():
+    """Test that the oldest lossy items are discarded when the deque is full."""
+    dq = NotifiableDeque(lossy_maxlen=2)
+    for i in range(5):
+        dq.append_lossy(i)
+
+    assert len(dq) == 2
+    assert list(dq.drain()) == [3, 4]
+
+
+def test_lossy_items_superseded():
+    """Test that lossy items are never drained after a more recent item."""
+    dq = NotifiableDeque()
+
+    # stale batch before a new epoch
+    dq.append_lossy("batch_99")
+    dq.append("epoch_3")
+    dq.append_lossy("batch_0")
+    assert list(dq.drain()) == ["epoch_3", "batch_0"]
+
+    # last batch guaranteed before the end of training
+    dq.append_lossy("batch_98")
+    dq.append("batch_99")
+    dq.append("loss")
+    dq.append("done")
+    assert list(dq.drain()) == ["batch_99", "loss", "done"]
+
+
+def test_wait_across_threads():
+    """Test that appending from another thread wakes up the consumer."""
+    dq = NotifiableDeque()
+
+    producer = Thread(target=lambda: [dq.append(i) for i in range(100)])
+    producer.start()
+
+    items = []
+    while len(items) < 100:
+        assert dq.wait(timeout=5)
+        items.extend(dq.drain())
+
+    producer.join()
+    assert items == list(range(100))
@@ -0,0 +1,50 @@
+import os
+
+import pytest
+
+from careamics_napari.utils.prefetch_utils import prefetch_path
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "posix_fadvise"), reason="posix_fadvise not available"
+)
+
+
+@pytest.fixture
+def fadvised(monkeypatch):
+    """Record the inodes of the files passed to `posix_fadvise`."""
+    calls = []
+
+    def fake_fadvise(fd, offset, length, advice):
+        calls.append(os.fstat(fd).st_ino)
+
+    monkeypatch.setattr(os, "posix_fadvise", fake_fadvise)
+    return calls
+
+
+def test_prefetch_file(tmp_path, fadvised):
+    """Test that a single file is prefetched."""
+    file = tmp_path / "image.tif"
+    file.write_bytes(b"0" * 16)
+
+    prefetch_path(file)
+
+    assert fadvised == [file.stat().st_ino]
+
+
+def test_prefetch_folder(tmp_path, fadvised):
+    """Test that all files in a folder are prefetched, ignoring sub-folders."""
+    files = [tmp_path / f"image_{i}.tif" for i in range(3)]
+    for file in files:
+        file.write_bytes(b"0" * 16)
+    (tmp_path / "subfolder").mkdir()
+
+    prefetch_path(str(tmp_path))
+
+    assert sorted(fadvised) == sorted(file.stat().st_ino for file in files)
+
+
+def test_prefetch_missing_path(tmp_path, fadvised):
+    """Test that a missing path is ignored."""
+    prefetch_path(tmp_path / "missing.tif")
+
+    assert fadvised == []
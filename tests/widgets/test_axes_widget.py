@@ -1,3 +1,16 @@
+from itertools import product
+
+from careamics_napari.utils import are_axes_valid
+from careamics_napari.widgets.axes_widget import _are_axes_valid
+
+
+def test_axes_regex_matches_are_axes_valid():
+    """Test that the axes regular expression agrees with `are_axes_valid`."""
+    for n in range(6):
+        for axes in map("".join, product("STCZYXxya", repeat=n)):
+            assert _are_axes_valid(axes) == are_axes_valid(axes), axes
+
+
 # @pytest.mark.qt
 # @pytest.mark.parametrize('shape_length', [i for i in range(2, 5)])
 # def test_axes_widget_no_Z_defaults(qtbot, shape_length):
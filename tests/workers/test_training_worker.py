@@ -0,0 +1,91 @@
+import pytest
+
+from careamics_napari.signals import (
+    TrainingSignal,
+    TrainingState,
+    TrainUpdate,
+    TrainUpdateType,
+)
+from careamics_napari.workers.training_worker import (
+    _coalesce_batches,
+    _validate_sources,
+)
+
+
+def test_coalesce_batches():
+    """Test that only the last batch update is kept, in order with the others."""
+    updates = [
+        TrainUpdate(TrainUpdateType.BATCH, 98),
+        TrainUpdate(TrainUpdateType.BATCH, 99),
+        TrainUpdate(TrainUpdateType.LOSS, 0.5),
+        TrainUpdate(TrainUpdateType.EPOCH, 1),
+        TrainUpdate(TrainUpdateType.BATCH, 0),
+        TrainUpdate(TrainUpdateType.BATCH, 1),
+        TrainUpdate(TrainUpdateType.STATE, TrainingState.DONE),
+    ]
+
+    assert _coalesce_batches(updates) == [
+        TrainUpdate(TrainUpdateType.LOSS, 0.5),
+        TrainUpdate(TrainUpdateType.EPOCH, 1),
+        TrainUpdate(TrainUpdateType.BATCH, 1),
+        TrainUpdate(TrainUpdateType.STATE, TrainingState.DONE),
+    ]
+
+
+def test_coalesce_batches_without_batch():
+    """Test that updates without batch updates are left unchanged."""
+    updates = [
+        TrainUpdate(TrainUpdateType.EPOCH, 1),
+        TrainUpdate(TrainUpdateType.LOSS, 0.5),
+    ]
+
+    assert _coalesce_batches(updates) == updates
+
+
+@pytest.mark.parametrize(
+    "algorithm, path_train, path_train_target",
+    [
+        ("n2v", "", ""),
+        ("care", "", "target"),
+        ("care", "train", ""),
+        ("n2n", "train", ""),
+    ],
+)
+def test_validate_sources_empty_paths(algorithm, path_train, path_train_target):
+    """Test that missing paths are reported as errors."""
+    config_signal = TrainingSignal()
+    config_signal.algorithm = algorithm
+    config_signal.path_train = path_train
+    config_signal.path_train_target = path_train_target
+
+    sources = _validate_sources(config_signal)
+
+    assert isinstance(sources.error, ValueError)
+
+
+def test_validate_sources_same_validation_path():
+    """Test that the validation path is ignored if it is the training path."""
+    config_signal = TrainingSignal()
+    config_signal.algorithm = "care"
+    config_signal.path_train = "train"
+    config_signal.path_val = "train"
+    config_signal.path_train_target = "target"
+    config_signal.path_val_target = "val_target"
+
+    sources = _validate_sources(config_signal)
+
+    assert sources.error is None
+    assert sources.train_source == "train"
+    assert sources.val_source is None
+    assert sources.train_target == "target"
+    assert sources.val_target is None
+
+
+def test_validate_sources_no_layer():
+    """Test that a missing training layer is reported as an error."""
+    config_signal = TrainingSignal()
+    config_signal.load_from_disk = False
+
+    sources = _validate_sources(config_signal)
+
+    assert isinstance(sources.error, ValueError)